@@ -1,11 +1,13 @@
+import asyncio
 import typer
+from functools import lru_cache
 from pathlib import Path
 from decimal import Decimal
 import os
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from services.alpaca_service import TradingService, AlpacaConfig
-from services.signal_processor import process_trading_signals
+from services.alpaca_service import AsyncTradingService, AlpacaConfig, get_trading_service
+from services.signal_processor import TradingSignal, process_trading_signals
 from utils.logger import setup_logger
 from utils.file_utils import get_latest_signals_file
 
@@ -14,6 +16,14 @@ app = typer.Typer()
 logger = setup_logger(name="main",
                       log_file=Path("src/logs/main.log"))
 
+# Upper bound on orders in flight at once, to avoid HTTP 429s from Alpaca
+MAX_CONCURRENT_ORDERS = 8
+
+@lru_cache(maxsize=1)
+def get_signals_dir() -> Path:
+    """Directory holding the daily orders_*.json files, read once from SIGNALS_DIR."""
+    return Path(os.environ.get("SIGNALS_DIR", "."))
+
 def confirm_trade(signal, shares, account_value: Decimal) -> bool:
     """Get user confirmation for trade execution."""
     trade_value = signal.entry_price * Decimal(str(shares))
@@ -30,11 +40,86 @@ def confirm_trade(signal, shares, account_value: Decimal) -> bool:
     
     return input("\nExecute trade? (Y/N): ").lower() == 'y'
 
+def collect_approved_orders(
+    signals_dict: Dict[str, List[Tuple[TradingSignal, int]]],
+    account_value: Decimal,
+    assume_yes: bool = False
+) -> Tuple[List[Tuple[TradingSignal, str]], int]:
+    """
+    Run all trade confirmations up front so orders can be sent together afterwards.
+    
+    Args:
+        signals_dict: Processed signals grouped by symbol
+        account_value: Current account value
+        assume_yes: Approve every valid trade without prompting
+        
+    Returns:
+        Tuple of (approved (signal, side) pairs, number of invalid signals)
+    """
+    approved: List[Tuple[TradingSignal, str]] = []
+    invalid = 0
+    
+    for symbol, signals in signals_dict.items():
+        for signal, shares in signals:
+            logger.info(
+                f"Signal - Symbol: {symbol} | Window: {signal.window_weeks}w | "
+                f"Type: {signal.signal_type} | Confidence: {signal.confidence:.2f} | "
+                f"R/R: {signal.risk_reward_ratio:.2f} | Shares: {shares}"
+            )
+            
+            side = signal.signal_type.lower()
+            if side not in ["buy", "sell"]:
+                logger.error(f"Invalid signal type for {symbol}: {side}")
+                invalid += 1
+                continue
+            
+            if not assume_yes and not confirm_trade(signal, shares, account_value):
+                logger.info(f"Trade skipped for {symbol}")
+                continue
+            
+            approved.append((signal, side))
+    
+    return approved, invalid
+
+async def place_orders(config: AlpacaConfig, approved: List[Tuple[TradingSignal, str]]) -> List[bool]:
+    """
+    Submit approved orders concurrently over one shared async session.
+    
+    At most MAX_CONCURRENT_ORDERS requests are in flight at once to stay
+    under Alpaca's order rate limit.
+    
+    Returns:
+        One success flag per approved order, in the same order
+    """
+    order_slots = asyncio.Semaphore(MAX_CONCURRENT_ORDERS)
+    
+    async with AsyncTradingService(config) as service:
+        async def submit(signal: TradingSignal, side: str) -> bool:
+            async with order_slots:
+                try:
+                    order = await service.place_stop_limit_order(
+                        symbol=signal.symbol,
+                        qty=1, #TODO: detect it automatically = shares variable
+                        limit_price=signal.entry_limit_price,
+                        stop_price=signal.entry_price,
+                        side=side,
+                        time_in_force="gtc"
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to place order for {signal.symbol}: {str(e)}")
+                    return False
+            
+            logger.info(f"Order placed successfully - ID: {order['id']} for {signal.symbol}")
+            return True
+        
+        return await asyncio.gather(*[submit(signal, side) for signal, side in approved])
+
 @app.command()
 def run(
     symbols: Optional[List[str]] = typer.Option(None, help="Stock symbols (e.g. AAPL MSFT)"),
     min_confidence: float = typer.Option(0.5, help="Minimum signal confidence"),
     min_risk_reward: float = typer.Option(1.5, help="Minimum risk/reward ratio"),
+    yes: bool = typer.Option(False, "--yes", "-y", help="Place all valid orders without confirmation"),
 ):
     """Execute trading strategy for specified symbols."""
     try:
@@ -43,13 +128,12 @@ def run(
             secret_key=os.getenv("SECRET_KEY"),
             paper=True
         )
-        trading_service = TradingService(config)
+        trading_service = get_trading_service(config)
         
         account_info = trading_service.get_account_info()
         account_value = account_info['portfolio_value']
         logger.info(f"Account value: ${account_value}")
-        signals_dir = Path("C:/Users/tomso/workspace/mlfinlab/mlfinlab/ch3/outputs/daily_orders")
-        signals_path = get_latest_signals_file(signals_dir)
+        signals_path = get_latest_signals_file(get_signals_dir())
         if signals_path is None:
             logger.error("No signals file found")
             return
@@ -65,44 +149,11 @@ def run(
             logger.info("No valid signals found matching criteria")
             return
             
-        orders_placed = 0
-        orders_failed = 0
+        approved, orders_failed = collect_approved_orders(signals_dict, account_value, assume_yes=yes)
         
-        for symbol, signals in signals_dict.items():
-            for signal, shares in signals:
-                logger.info(
-                    f"Signal - Symbol: {symbol} | Window: {signal.window_weeks}w | "
-                    f"Type: {signal.signal_type} | Confidence: {signal.confidence:.2f} | "
-                    f"R/R: {signal.risk_reward_ratio:.2f} | Shares: {shares}"
-                )
-                
-                if not confirm_trade(signal, shares, account_value):
-                    logger.info(f"Trade skipped for {symbol}")
-                    continue
-                
-                try:
-                    side = signal.signal_type.lower()
-                    if side not in ["buy", "sell"]:
-                        logger.error(f"Invalid signal type for {symbol}: {side}")
-                        orders_failed += 1
-                        continue
-                    
-                    order = trading_service.place_stop_limit_order(
-                        symbol=signal.symbol,
-                        qty=1, #TODO: detect it automatically = shares variable
-                        limit_price=signal.entry_limit_price,
-                        stop_price=signal.entry_price,
-                        side=side,
-                        time_in_force="gtc"
-                    )
-                    
-                    logger.info(f"Order placed successfully - ID: {order.id} for {symbol}")
-                    orders_placed += 1
-                    
-                except Exception as e:
-                    logger.error(f"Failed to place order for {symbol}: {str(e)}")
-                    orders_failed += 1
-                    continue
+        results = asyncio.run(place_orders(config, approved))
+        orders_placed = sum(results)
+        orders_failed += len(results) - orders_placed
         
         logger.info(f"Execution complete - Orders placed: {orders_placed}, Failed: {orders_failed}")
 
@@ -9,7 +9,7 @@ import os
 import asyncio
 from pathlib import Path
 
-from services.alpaca_service import TradingService, AlpacaConfig
+from services.alpaca_service import AlpacaConfig, get_trading_service
 from services.order_monitor import OrderMonitor
 
 from utils.logger import setup_logger
@@ -27,17 +27,23 @@ async def run_monitor():
             secret_key=os.getenv("SECRET_KEY"),
             paper=True
         )
-        trading_service = TradingService(config)
+        trading_service = get_trading_service(config)
         
         logger.info("Starting order monitoring...")
         monitor = OrderMonitor(trading_service.client)
-
-        while True:
-            status = await monitor.get_active_positions_and_orders()
-            logger.info("Current Portfolio Status:")
-            logger.info(f"Positions: {status['positions']}")
-            logger.info(f"Open Orders: {status['orders']}")
-            await asyncio.sleep(monitor.check_interval)
+        # Fills and cancellations arrive over the trade-updates websocket
+        monitor_task = asyncio.create_task(monitor.start_monitoring())
+
+        try:
+            while True:
+                status = await monitor.get_active_positions_and_orders()
+                logger.info("Current Portfolio Status:")
+                logger.info(f"Positions: {status['positions']}")
+                logger.info(f"Open Orders: {status['orders']}")
+                await asyncio.sleep(monitor.check_interval)
+        finally:
+            monitor.stop_monitoring()
+            monitor_task.cancel()
             
     except KeyboardInterrupt:
         logger.info("Monitoring stopped by user")
@@ -1,9 +1,14 @@
-from dataclasses import dataclass
+import asyncio
+import atexit
+from dataclasses import astuple, dataclass
 from typing import Optional, Dict, Any
 from pathlib import Path
 from decimal import Decimal
 from typing import Dict, Any
 
+import aiohttp
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from alpaca.trading.client import TradingClient
 from alpaca.trading.requests import StopLimitOrderRequest
 from alpaca.trading.enums import OrderSide, TimeInForce
@@ -23,12 +28,32 @@ class AlpacaConfig:
 
 class TradingService:
     def __init__(self, config: AlpacaConfig):
+        self.config = config
         self.client = TradingClient(
             api_key=config.api_key,
             secret_key=config.secret_key,
             paper=config.paper,
             url_override=config.base_url
         )
+        # alpaca-py keeps a requests.Session on the client; mount a pooled
+        # keep-alive adapter so repeated calls skip the TCP+TLS handshake.
+        # The adapter belongs to this instance only, so close() cannot drop
+        # another service's connections; share the instance instead via
+        # get_trading_service.
+        self._session = getattr(self.client, "_session", None)
+        if self._session is not None:
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=32,
+                max_retries=Retry(total=3, backoff_factor=0.2)
+            )
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+
+    def close(self):
+        """Release pooled connections held by the underlying HTTP session."""
+        if self._session is not None:
+            self._session.close()
         
     def get_account_info(self) -> Dict[str, Any]:
         """Get account information and available buying power."""
@@ -97,4 +122,133 @@ class TradingService:
             raise ValueError(f"Invalid order parameters: {str(e)}")
         except Exception as e:
             logger.error(f"Failed to place order: {str(e)}")
-            raise RuntimeError(f"Order placement failed: {str(e)}")
\ No newline at end of file
+            raise RuntimeError(f"Order placement failed: {str(e)}")
+
+
+
+# One TradingService per configuration, shared for the life of the process
+_services: Dict[tuple, TradingService] = {}
+
+def get_trading_service(config: AlpacaConfig) -> TradingService:
+    """
+    Return the process-wide TradingService for this configuration.
+    
+    main and monitoring share one client, and with it one connection pool,
+    instead of each building their own. Instances are never closed while
+    callers may still hold them; close_trading_services runs at exit.
+    """
+    key = astuple(config)
+    service = _services.get(key)
+    if service is None:
+        service = _services[key] = TradingService(config)
+    return service
+
+def close_trading_services() -> None:
+    """Close every shared TradingService; called once when the process exits."""
+    while _services:
+        _, service = _services.popitem()
+        service.close()
+
+atexit.register(close_trading_services)
+
+class AsyncTradingService:
+    """
+    Asynchronous order client for the Alpaca REST API.
+
+    Holds a single aiohttp session so concurrent orders share one pool of
+    keep-alive connections instead of paying a TCP+TLS handshake each.
+    """
+
+    PAPER_URL = "https://paper-api.alpaca.markets"
+    LIVE_URL = "https://api.alpaca.markets"
+
+    def __init__(self, config: AlpacaConfig):
+        self.config = config
+        self.base_url = config.base_url or (self.PAPER_URL if config.paper else self.LIVE_URL)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncTradingService":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Create the shared session lazily so it binds to the running event loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=75),
+                headers={
+                    "APCA-API-KEY-ID": self.config.api_key,
+                    "APCA-API-SECRET-KEY": self.config.secret_key,
+                }
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def place_stop_limit_order(
+    self,
+    symbol: str,
+    qty: int,
+    limit_price: Decimal,
+    stop_price: Decimal,
+    side: str = "buy",
+    time_in_force: str = "gtc"
+) -> Dict[str, Any]:
+        """
+        Places a stop-limit order through the Alpaca REST API.
+
+        Same semantics as TradingService.place_stop_limit_order, but the
+        request is sent over the shared async session so several orders
+        can be in flight at once.
+
+        Args:
+            symbol: Stock symbol
+            qty: Number of shares
+            limit_price: Maximum price to pay (for buy) or minimum price to sell
+            stop_price: Price that triggers the limit order
+            side: 'buy' or 'sell'
+            time_in_force: Order duration ('gtc', 'day', etc.)
+
+        Returns:
+            Dict containing order details as returned by Alpaca
+
+        Raises:
+            ValueError: If invalid parameters provided
+            RuntimeError: If order placement fails
+        """
+        try:
+            order_side = "buy" if side.lower() == "buy" else "sell"
+            order_tif = "gtc" if time_in_force.lower() == "gtc" else "day"
+
+            # Round prices to 2 decimal places
+            payload = {
+                "symbol": symbol,
+                "qty": str(qty),
+                "side": order_side,
+                "type": "stop_limit",
+                "time_in_force": order_tif,
+                "limit_price": str(round(limit_price, 2)),
+                "stop_price": str(round(stop_price, 2))
+            }
+        except (ValueError, ArithmeticError) as e:
+            raise ValueError(f"Invalid order parameters: {str(e)}")
+
+        # Failures are raised to the caller, which logs them with the order context
+        try:
+            async with self._get_session().post(f"{self.base_url}/v2/orders", json=payload) as response:
+                status = response.status
+                body = await response.text() if status >= 400 else await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise RuntimeError(f"Order placement failed: {str(e)}")
+
+        if status >= 400:
+            raise RuntimeError(f"Order placement failed: HTTP {status}: {body}")
+
+        logger.info(f"Placed {side} stop-limit order for {qty} shares of {symbol}")
+        return body
@@ -6,19 +6,67 @@ Provides real-time monitoring of order status, position tracking, and risk manag
 """
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date
 from decimal import Decimal
-from typing import Dict, List
+from operator import attrgetter
+from typing import Dict, List, Optional, Tuple
 import logging
 import asyncio
+from alpaca.common.enums import BaseURL
 from alpaca.trading.client import TradingClient
+from alpaca.trading.stream import TradingStream
 from alpaca.trading.requests import GetOrdersRequest
-from alpaca.trading.enums import QueryOrderStatus, OrderStatus
+from alpaca.trading.enums import QueryOrderStatus, OrderStatus, TradeEvent
 
 from utils.logger import setup_logger
 
 logger = setup_logger(name="order_monitor")
 
+# Trade-update events that close an order without a fill
+_CANCEL_EVENTS = ("canceled", "expired")
+
+# Output keys and the Alpaca attributes they are read from
+_POSITION_FIELDS = (
+    ('symbol', 'symbol'),
+    ('qty', 'qty'),
+    ('entry_price', 'avg_entry_price'),
+    ('current_price', 'current_price'),
+    ('unrealized_pl', 'unrealized_pl'),
+    ('unrealized_plpc', 'unrealized_plpc'),
+    ('market_value', 'market_value'),
+    ('cost_basis', 'cost_basis'),
+)
+_ORDER_FIELDS = (
+    'id', 'symbol', 'side', 'type', 'qty', 'filled_qty',
+    'limit_price', 'stop_price', 'status', 'created_at', 'updated_at',
+)
+
+_POSITION_KEYS = tuple(key for key, _ in _POSITION_FIELDS)
+_get_position_values = attrgetter(*(attr for _, attr in _POSITION_FIELDS))
+_get_order_values = attrgetter(*_ORDER_FIELDS)
+
+def _position_dict(pos) -> dict:
+    """Convert an Alpaca position into a plain dictionary."""
+    return dict(zip(_POSITION_KEYS, _get_position_values(pos)))
+
+def _order_dict(order) -> dict:
+    """Convert an Alpaca order into a plain dictionary."""
+    return dict(zip(_ORDER_FIELDS, _get_order_values(order)))
+
+def _stream_url(base_url) -> Optional[str]:
+    """
+    Return the trade-updates websocket URL for a REST base URL override.
+    
+    The default Alpaca endpoints (BaseURL members) return None so the
+    stream picks its own default; a custom http(s) URL maps to ws(s) on
+    the same host under /stream.
+    """
+    if not isinstance(base_url, str) or isinstance(base_url, BaseURL):
+        return None
+    if base_url.startswith("http"):
+        base_url = "ws" + base_url[len("http"):]
+    return base_url.rstrip("/") + "/stream"
+
 @dataclass
 class OrderMonitor:
     """
@@ -27,33 +75,64 @@ class OrderMonitor:
     Attributes:
         client (TradingClient): Alpaca trading client instance
         check_interval (int): Seconds between order status checks
+        stream (Optional[TradingStream]): Trade-updates stream, built from the client's credentials when not given
+        use_stream (bool): Push updates over the websocket; polls when False
         active_orders (Dict[str, dict]): Dictionary of currently active orders
         _running (bool): Internal flag for monitoring loop control
     """
     
     client: TradingClient
     check_interval: int = 60  # Seconds between order checks
+    stream: Optional[TradingStream] = None
+    use_stream: bool = True
     
-    def __init__(self, client: TradingClient, check_interval: int = 60):
+    def __init__(
+        self,
+        client: TradingClient,
+        check_interval: int = 60,
+        stream: Optional[TradingStream] = None,
+        use_stream: bool = True
+    ):
         """
         Initialize the OrderMonitor service.
         
         Args:
             client: Initialized Alpaca trading client
             check_interval: Time between order checks in seconds
+            stream: Optional trade-updates stream; built from the client when omitted
+            use_stream: Set False to poll order status instead of streaming
         """
         self.client = client
         self.check_interval = check_interval
+        self.stream = stream
+        self.use_stream = use_stream
+        self._stop_task: Optional[asyncio.Task] = None
         self.active_orders: Dict[str, dict] = {}
         self._running = False
+        self._cached_date_str = ""
+        self._cached_date_ord = 0
+        self._orders_req_cache: Optional[Tuple[int, GetOrdersRequest]] = None
     
     async def start_monitoring(self):
         """
         Start the asynchronous order monitoring loop.
-        Continuously checks order status at specified intervals.
+        
+        With a trade-updates stream, open orders are reconciled once over REST
+        and fills/cancellations are then pushed over the websocket. Without
+        one, order status is polled at the configured interval.
         """
         self._running = True
         logger.info("Order monitoring started")
+        
+        if self.stream is None and self.use_stream:
+            self.stream = self._build_stream()
+        
+        if self.stream is not None:
+            await self._check_orders()
+            self.stream.subscribe_trade_updates(self._on_trade_update)
+            await self.stream._run_forever()
+            return
+        
         while self._running:
             try:
                 await self._check_orders()
@@ -62,23 +141,79 @@ class OrderMonitor:
                 logger.error(f"Error in order monitoring loop: {str(e)}")
                 await asyncio.sleep(self.check_interval)
     
+    def _build_stream(self) -> Optional[TradingStream]:
+        """Create a trade-updates stream using the REST client's API key credentials."""
+        api_key = getattr(self.client, "_api_key", None)
+        secret_key = getattr(self.client, "_secret_key", None)
+        if not (api_key and secret_key):
+            logger.warning("No API key credentials on client, falling back to polling")
+            return None
+        return TradingStream(
+            api_key,
+            secret_key,
+            paper=getattr(self.client, "_sandbox", True),
+            url_override=_stream_url(getattr(self.client, "_base_url", None))
+        )
+    
     def stop_monitoring(self):
         """Stop the order monitoring loop."""
         self._running = False
+        if self.stream is not None:
+            try:
+                # Keep a reference so the task isn't garbage-collected before it runs
+                self._stop_task = asyncio.get_running_loop().create_task(self.stream.stop_ws())
+            except RuntimeError:
+                # Called from outside the event loop thread; a stream that
+                # never started has no loop and nothing to stop
+                if getattr(self.stream, "_loop", None) is not None:
+                    self.stream.stop()
         logger.info("Order monitoring stopped")
     
+    async def _on_trade_update(self, data):
+        """
+        Handle a trade update pushed by the Alpaca websocket.
+        
+        Args:
+            data: TradeUpdate carrying the event type and the affected order
+        """
+        order = data.order
+        try:
+            if data.event == TradeEvent.NEW:
+                self.active_orders[order.id] = order
+            elif data.event == TradeEvent.FILL:
+                self.active_orders.pop(order.id, None)
+                await self._handle_filled_order(order)
+            elif data.event in _CANCEL_EVENTS:
+                self.active_orders.pop(order.id, None)
+                await self._handle_cancelled_order(order)
+        except Exception as e:
+            logger.error(f"Error handling trade update for {order.id}: {str(e)}")
+    
+    def _today_str(self) -> str:
+        """Return today's date as YYYY-MM-DD, recomputed only when the day changes."""
+        today = date.today().toordinal()
+        if self._cached_date_ord != today:
+            self._cached_date_ord = today
+            self._cached_date_str = date.fromordinal(today).isoformat()
+        return self._cached_date_str
+    
+    def _orders_request(self) -> GetOrdersRequest:
+        """Return the open-orders request for today, built once per day."""
+        after = self._today_str()
+        if self._orders_req_cache is None or self._orders_req_cache[0] != self._cached_date_ord:
+            self._orders_req_cache = (
+                self._cached_date_ord,
+                GetOrdersRequest(status=QueryOrderStatus.OPEN, after=after)
+            )
+        return self._orders_req_cache[1]
+    
     async def _check_orders(self):
         """
         Check status of all active orders and process updates.
         Retrieves current orders and compares with previously active orders.
         """
         try:
-            today = datetime.now()
-            orders_request = GetOrdersRequest(
-                status=QueryOrderStatus.OPEN,
-                after=today.strftime('%Y-%m-%d')
-            )
-            orders = self.client.get_orders(orders_request)
+            orders = self.client.get_orders(self._orders_request())
             
             # Update active orders
             current_orders = {order.id: order for order in orders}
@@ -161,44 +296,13 @@ class OrderMonitor:
     async def get_active_positions_and_orders(self) -> Dict[str, List[dict]]:
         """Get current active positions and orders with detailed status."""
         try:
-            # Get positions
-            positions = self.client.get_all_positions()
-            position_data = [
-                {
-                    'symbol': pos.symbol,
-                    'qty': pos.qty,
-                    'entry_price': pos.avg_entry_price,
-                    'current_price': pos.current_price,
-                    'unrealized_pl': pos.unrealized_pl,
-                    'unrealized_plpc': pos.unrealized_plpc,
-                    'market_value': pos.market_value,
-                    'cost_basis': pos.cost_basis
-                }
-                for pos in positions
-            ]
-            
-            # Get orders
-            orders_request = GetOrdersRequest(
-                status=QueryOrderStatus.OPEN,
-                after=datetime.now().strftime('%Y-%m-%d')
+            # The client is synchronous, so run both requests in worker threads
+            positions, orders = await asyncio.gather(
+                asyncio.to_thread(self.client.get_all_positions),
+                asyncio.to_thread(self.client.get_orders, self._orders_request())
             )
-            orders = self.client.get_orders(orders_request)
-            order_data = [
-                {
-                    'id': order.id,
-                    'symbol': order.symbol,
-                    'side': order.side,
-                    'type': order.type,
-                    'qty': order.qty,
-                    'filled_qty': order.filled_qty,
-                    'limit_price': order.limit_price,
-                    'stop_price': order.stop_price,
-                    'status': order.status,
-                    'created_at': order.created_at,
-                    'updated_at': order.updated_at
-                }
-                for order in orders
-            ]
+            position_data = [_position_dict(pos) for pos in positions]
+            order_data = [_order_dict(order) for order in orders]
             
             logger.info(f"Active positions: {len(position_data)} | Open orders: {len(order_data)}")
             return {
@@ -218,20 +322,8 @@ class OrderMonitor:
             List of dictionaries containing position information
         """
         try:
-            positions = self.client.get_all_positions()
-            position_data = [
-                {
-                    'symbol': pos.symbol,
-                    'qty': pos.qty,
-                    'entry_price': pos.avg_entry_price,
-                    'current_price': pos.current_price,
-                    'unrealized_pl': pos.unrealized_pl,
-                    'unrealized_plpc': pos.unrealized_plpc,
-                    'market_value': pos.market_value,
-                    'cost_basis': pos.cost_basis
-                }
-                for pos in positions
-            ]
+            positions = await asyncio.to_thread(self.client.get_all_positions)
+            position_data = [_position_dict(pos) for pos in positions]
             logger.info(f"Active positions count: {len(position_data)}")
             return position_data
             
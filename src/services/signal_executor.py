@@ -1,15 +1,35 @@
 import subprocess
+import contextlib
+import importlib
+import io
 import logging
+import re
 import venv
 import os
-from typing import Optional, Dict
+from types import ModuleType
+from typing import Any, Optional, Dict, Tuple
 from pathlib import Path
 
+# "key: value" lines in script output
+_KV_RE = re.compile(r'^([^:\n]+):[ \t]*(.*)$', re.M)
+
 class SignalExecutor:
-    def __init__(self, script_path: str, project_path: str):
+    """
+    Run a signal script from another Poetry project and parse its output.
+    
+    If module_name is given and importable from this interpreter, the module's
+    main() is called in-process with project_path as the working directory,
+    avoiding a 'poetry run python' start-up per call. Otherwise, or when the
+    module has no main(), the script runs in a subprocess.
+    """
+
+    def __init__(self, script_path: str, project_path: str, module_name: Optional[str] = None):
         self.script_path = Path(script_path)
         self.project_path = Path(project_path)
+        self.module_name = module_name
         self.logger = logging.getLogger(__name__)
+        self._module: Optional[ModuleType] = None
+        self._import_failed = False
         
         if not self.script_path.exists():
             raise FileNotFoundError(f"Script not found: {script_path}")
@@ -20,8 +40,75 @@ class SignalExecutor:
         if not (self.project_path / "poetry.lock").exists():
             raise FileNotFoundError(f"poetry.lock not found in {project_path}")
 
+    def _load_module(self) -> Optional[ModuleType]:
+        """Import the signal module once; None if it is unavailable or has no main()."""
+        if self._module is None and self.module_name and not self._import_failed:
+            try:
+                module = importlib.import_module(self.module_name)
+            except ImportError as e:
+                self.logger.warning(f"Cannot import {self.module_name}, falling back to subprocess: {str(e)}")
+                self._import_failed = True
+                return None
+            if not callable(getattr(module, "main", None)):
+                self.logger.warning(f"{self.module_name} has no main(), falling back to subprocess")
+                self._import_failed = True
+                return None
+            self._module = module
+        return self._module
+
+    def _run_in_process(self) -> Optional[Tuple[Any, str]]:
+        """
+        Import the module and call its main() from project_path, capturing stdout.
+        
+        Returns:
+            (main() return value, captured output), or None to use the subprocess
+        
+        Raises:
+            RuntimeError: If the script fails
+        """
+        if not self.module_name or self._import_failed:
+            return None
+        
+        buffer = io.StringIO()
+        try:
+            # Match the subprocess: same working directory, and output printed
+            # while importing counts as script output
+            with contextlib.chdir(self.project_path), contextlib.redirect_stdout(buffer):
+                module = self._load_module()
+                if module is None:
+                    return None
+                result = module.main()
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                self.logger.error(f"Script execution failed with exit code {e.code}")
+                raise RuntimeError(f"Failed to execute script: exit code {e.code}")
+            result = None
+        except Exception as e:
+            self.logger.error(f"Script execution failed: {str(e)}")
+            raise RuntimeError(f"Failed to execute script: {str(e)}") from e
+        return result, buffer.getvalue()
+
+    def execute(self) -> Optional[Dict]:
+        """
+        Run the signal script and return its structured output.
+        
+        When the script runs in-process and its main() returns a dict, that
+        value is used directly; otherwise the printed output is parsed.
+        """
+        in_process = self._run_in_process()
+        if in_process is not None:
+            result, output = in_process
+            if isinstance(result, dict):
+                return result
+            return self.parse_output(output)
+        return self.parse_output(self.execute_script())
+
     def execute_script(self) -> Optional[str]:
-        """Execute external Python script using poetry and return its output."""
+        """Execute the signal script and return its output, in-process when possible."""
+        in_process = self._run_in_process()
+        if in_process is not None:
+            return in_process[1]
+        
         try:
             # Check if poetry is installed
             subprocess.run(
@@ -58,11 +145,10 @@ class SignalExecutor:
             return None
             
         try:
-            signal_data = {}
-            for line in output.strip().split('\n'):
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    signal_data[key.strip()] = value.strip()
+            signal_data = {
+                match.group(1).strip(): match.group(2).strip()
+                for match in _KV_RE.finditer(output)
+            }
                     
             if not signal_data:
                 self.logger.warning("No valid key-value pairs found in output")
@@ -6,9 +6,12 @@ from typing import Dict, List, Optional, Tuple
 import json
 import logging
 
+import numpy as np
+import orjson
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradingSignal:
     date: str
     symbol: str
@@ -26,6 +29,10 @@ class TradingSignal:
     risk_reward_ratio: float
     window_weeks: int  # Added field for time window
 
+def _to_decimal(value) -> Decimal:
+    """Convert a JSON number or numeric string to Decimal without a redundant str() round-trip."""
+    return Decimal(value) if isinstance(value, str) else Decimal(str(value))
+
 def parse_signal_key(key: str) -> Tuple[str, int]:
     """Parse symbol and window from signal key (e.g., 'AAPL_w1' -> ('AAPL', 1))"""
     symbol, window = key.split('_w')
@@ -49,30 +56,50 @@ def process_trading_signals(
         min_risk_reward: Minimum risk/reward ratio threshold
     """
     try:
-        with open(json_path) as f:
-            data = json.load(f)
+        with open(json_path, 'rb') as f:
+            data = orjson.loads(f.read())
         
         signals: Dict[str, List[Tuple[TradingSignal, int]]] = {}
         
-        for key, signal_data in data.items():
+        target_set = frozenset(target_symbols) if target_symbols else None
+        
+        # Drop untargeted symbols by key prefix before touching the payload
+        keys: List[str] = []
+        for key in data:
+            if target_set is not None and key[:key.index('_w')] not in target_set:
+                continue
+            keys.append(key)
+        
+        # Filter the remaining signals at once with boolean masks
+        confidence = np.array([data[key]['signal']['confidence'] for key in keys], dtype=np.float64)
+        risk_reward = np.array([data[key]['metrics']['risk_reward_ratio'] for key in keys], dtype=np.float64)
+        
+        mask = (confidence >= min_confidence) & (risk_reward >= min_risk_reward)
+        survivors = np.flatnonzero(mask)
+        
+        # Only survivors are sized, so exact Decimal math stays cheap
+        for i in survivors:
+            key = keys[i]
             symbol, window_weeks = parse_signal_key(key)
+            signal_data = data[key]
             
-            if (target_symbols and symbol not in target_symbols or
-                signal_data['signal']['confidence'] < min_confidence or
-                signal_data['metrics']['risk_reward_ratio'] < min_risk_reward):
-                continue
+            entry_price = _to_decimal(signal_data['orders']['entry']['stop_price'])
+            if entry_price <= 0:
+                raise ValueError(f"Invalid entry price for {key}: {entry_price}")
+            position_pct = float(signal_data['position_size']['recommended_size'].split('%')[0]) / 100
+            position_size = int(account_value * Decimal(str(position_pct)) / entry_price)
                 
             signal = TradingSignal(
                 date=signal_data['date'],
                 symbol=symbol,
                 signal_type=signal_data['signal']['type'],
                 confidence=float(signal_data['signal']['confidence']),
-                current_price=Decimal(str(signal_data['current_price'])),
-                entry_price=Decimal(str(signal_data['orders']['entry']['stop_price'])),
-                entry_limit_price=Decimal(str(signal_data['orders']['entry']['limit_price'])),
-                take_profit=Decimal(str(signal_data['orders']['take_profit']['price'])),
-                stop_loss=Decimal(str(signal_data['orders']['stop_loss']['price'])),
-                position_size=float(signal_data['position_size']['recommended_size'].split('%')[0]) / 100,
+                current_price=_to_decimal(signal_data['current_price']),
+                entry_price=entry_price,
+                entry_limit_price=_to_decimal(signal_data['orders']['entry']['limit_price']),
+                take_profit=_to_decimal(signal_data['orders']['take_profit']['price']),
+                stop_loss=_to_decimal(signal_data['orders']['stop_loss']['price']),
+                position_size=position_pct,
                 time_barrier_days=int(signal_data['time_barrier']['days']),
                 expiry_date=signal_data['time_barrier']['expiry_date'],
                 volatility=float(signal_data['metrics']['daily_volatility']),
@@ -80,14 +107,12 @@ def process_trading_signals(
                 window_weeks=window_weeks
             )
             
-            position_size = int(account_value * Decimal(str(signal.position_size)) / signal.entry_price)
-            
             if symbol not in signals:
                 signals[symbol] = []
             signals[symbol].append((signal, position_size))
         
         return signals
         
-    except (json.JSONDecodeError, KeyError, ValueError) as e:
+    except (json.JSONDecodeError, orjson.JSONDecodeError, KeyError, ValueError) as e:
         logger.error(f"Error processing signals file: {str(e)}")
         raise
\ No newline at end of file
@@ -1,13 +1,43 @@
 # src/utils/file_utils.py
 
+import fnmatch
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 from datetime import datetime
 
 from utils.logger import setup_logger
 
 logger = setup_logger(name="file_utils")
 
+@lru_cache(maxsize=16)
+def _matching_files(base_path: Path, file_pattern: str, dir_mtime_ns: int) -> Tuple[str, ...]:
+    """
+    Return the paths of files in base_path matching the pattern.
+    
+    dir_mtime_ns is only part of the cache key: adding, removing or renaming
+    a file bumps the directory mtime, which invalidates the cached listing.
+    Rewriting a file in place does not, so mtimes are never cached here.
+    """
+    with os.scandir(base_path) as entries:
+        return tuple(
+            entry.path for entry in entries
+            if entry.is_file() and fnmatch.fnmatch(entry.name, file_pattern)
+        )
+
+def _newest(paths: Tuple[str, ...]) -> Optional[Tuple[int, Path]]:
+    """Return (mtime_ns, path) of the most recently modified path, read fresh."""
+    latest = None
+    for path in paths:
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            continue
+        if latest is None or mtime_ns > latest[0]:
+            latest = (mtime_ns, path)
+    return None if latest is None else (latest[0], Path(latest[1]))
+
 def get_latest_signals_file(
     base_dir: str | Path,
     file_pattern: str = "orders_*.json"
@@ -30,18 +60,18 @@ def get_latest_signals_file(
         if not base_path.exists():
             raise FileNotFoundError(f"Directory not found: {base_dir}")
             
-        # Find all matching files
-        signal_files = list(base_path.glob(file_pattern))
+        # Long-running callers skip re-listing an unchanged directory; each
+        # match is still stat'ed so in-place rewrites are picked up
+        latest = _newest(_matching_files(base_path, file_pattern, base_path.stat().st_mtime_ns))
         
-        if not signal_files:
+        if latest is None:
             logger.warning(f"No signal files found matching pattern '{file_pattern}' in {base_dir}")
             return None
             
-        # Sort files by modification time (newest first)
-        latest_file = max(signal_files, key=lambda p: p.stat().st_mtime)
+        latest_mtime_ns, latest_file = latest
         
         logger.info(f"Found latest signals file: {latest_file.name}")
-        logger.debug(f"Modified: {datetime.fromtimestamp(latest_file.stat().st_mtime)}")
+        logger.debug(f"Modified: {datetime.fromtimestamp(latest_mtime_ns / 1e9)}")
         
         return latest_file
         
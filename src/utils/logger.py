@@ -2,9 +2,62 @@
 
 """Logging configuration utilities for the trading platform."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
+
+class _RoutedQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that tags each record with the logger it is attached to."""
+    
+    def __init__(self, log_queue: queue.SimpleQueue, route: str):
+        super().__init__(log_queue)
+        self.route = route
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = super().prepare(record)
+        # Child loggers propagate into this handler, so record.name alone
+        # does not identify which configured handlers should receive it
+        record.log_route = self.route
+        return record
+
+class _LoggerRouter(logging.Handler):
+    """Dispatch queued records to the handlers configured for their logger."""
+    
+    def __init__(self):
+        super().__init__()
+        self.routes: Dict[str, List[logging.Handler]] = {}
+    
+    def handle(self, record: logging.LogRecord) -> bool:
+        for handler in self.routes.get(getattr(record, "log_route", record.name), ()):
+            handler.handle(record)
+        return True
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        self.handle(record)
+
+# One queue and one listener thread shared by every configured logger
+_log_queue = queue.SimpleQueue()
+_router = _LoggerRouter()
+_listener: Optional[logging.handlers.QueueListener] = None
+
+def _ensure_listener() -> None:
+    """Start the shared queue listener on first use."""
+    global _listener
+    if _listener is None:
+        _listener = logging.handlers.QueueListener(_log_queue, _router)
+        _listener.start()
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the shared listener, if running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+atexit.register(_stop_listener)
 
 def setup_logger(
     name: str = "",
@@ -15,6 +68,10 @@ def setup_logger(
     """
     Configure logging with console and optional file output.
     
+    Records from all loggers go through one queue and are written by a
+    single background listener thread. Calling this again for a logger that is already configured
+    returns it unchanged.
+    
     Args:
         name: Logger name
         level: Logging level
@@ -25,20 +82,33 @@ def setup_logger(
         Configured logger instance
     """
     logger = logging.getLogger(name)
+    if logger.handlers:
+        # Already configured; don't stack duplicate handlers
+        return logger
+    
     logger.setLevel(level)
+    logger.propagate = False
     
     formatter = logging.Formatter(format)
+    handlers = []
     
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # File handler if specified
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file)
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=5_000_000, backupCount=3
+        )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Callers only enqueue records; the shared listener thread does the actual I/O
+    _router.routes[logger.name] = handlers
+    _ensure_listener()
+    logger.addHandler(_RoutedQueueHandler(_log_queue, logger.name))
     
     return logger
\ No newline at end of file
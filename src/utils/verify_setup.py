@@ -1,74 +1,201 @@
+import asyncio
 import os
 import sys
+import time
+import weakref
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
 
-from alpaca.trading.client import TradingClient
-from alpaca.trading.enums import OrderStatus, AccountStatus
+# alpaca-py is imported lazily: pulling in its trading stack is slow and not
+# needed just to import this module
+if TYPE_CHECKING:
+    from alpaca.trading.client import TradingClient
+
+@lru_cache(maxsize=4)
+def _client(api_key: str, secret_key: str, paper: bool = True) -> "TradingClient":
+    """Return a TradingClient per credential set; its session keeps connections alive between calls."""
+    from alpaca.trading.client import TradingClient
+
+    return TradingClient(api_key=api_key, secret_key=secret_key, paper=paper)
+
+# Seconds a fetched account snapshot is reused before hitting the API again
+_ACCOUNT_TTL = 2.0
+# Weakly keyed by client: entries go with their client, so a recycled id()
+# can never pick up another account's snapshot
+_account_cache: "weakref.WeakKeyDictionary[TradingClient, tuple[float, Any]]" = weakref.WeakKeyDictionary()
+
+def _get_account_cached(client: "TradingClient") -> Any:
+    """Return client.get_account(), reusing a snapshot younger than _ACCOUNT_TTL."""
+    now = time.monotonic()
+    cached = _account_cache.get(client)
+    if cached is not None and now - cached[0] < _ACCOUNT_TTL:
+        return cached[1]
+    account = client.get_account()
+    _account_cache[client] = (now, account)
+    return account
+
+def _invalidate_account_cache(client: Optional["TradingClient"] = None) -> None:
+    """Drop the cached snapshot for client, or all snapshots, so the next call refetches."""
+    if client is None:
+        _account_cache.clear()
+    else:
+        _account_cache.pop(client, None)
+
+class TradingStatus(NamedTuple):
+    account_active: bool
+    trading_enabled: bool
+    account_healthy: bool
+    day_trades: int
+    pdt_status: bool
+
+@dataclass(slots=True)
+class BuyingPower:
+    """Account balances, parsed to Decimal only when read."""
+    _account: Any
+
+    @property
+    def total_portfolio(self) -> Decimal:
+        return Decimal(self._account.portfolio_value)
+
+    @property
+    def buying_power(self) -> Decimal:
+        return Decimal(self._account.buying_power)
+
+    @property
+    def cash(self) -> Decimal:
+        return Decimal(self._account.cash)
+
+    @property
+    def margin_multiplier(self) -> str:
+        return self._account.multiplier
+
+# Status marks indexed by a bool check result
+_MARKS = ('✗', '✓')
+
+# Report sections, filled in by _amain
+STATUS_TEMPLATE = (
+    "\nTrading Status:\n"
+    "Account Active: {account_active}\n"
+    "Trading Enabled: {trading_enabled}\n"
+    "Account Healthy: {account_healthy}\n"
+    "Day Trades Today: {day_trades}\n"
+    "Pattern Day Trader: {pdt_status}\n"
+    "Market Open: {market_open}"
+)
+BALANCE_TEMPLATE = (
+    "\nAccount Balance:\n"
+    "Portfolio Value: ${total_portfolio:,.2f}\n"
+    "Buying Power: ${buying_power:,.2f}\n"
+    "Cash: ${cash:,.2f}\n"
+    "Margin Multiplier: {margin_multiplier}x\n"
+    "Open Positions: {open_positions}"
+)
+
+_CENT = Decimal("0.01")
+
+def _cents(value: Decimal) -> float:
+    """Round to cents in Decimal before the float conversion, so displayed cents match Decimal formatting."""
+    return float(value.quantize(_CENT))
+
+# Maximum Alpaca requests in flight at once while loading
+_REQUEST_LIMIT = 5
 
 class AccountVerification:
+    __slots__ = ("client", "account", "clock", "positions")
+
+    _AccountStatus = None
+
     def __init__(self, api_key: str, secret_key: str):
-        self.client = TradingClient(api_key=api_key, secret_key=secret_key, paper=True)
-        self.account = self.client.get_account()
-
-    def verify_trading_status(self) -> dict[str, Any]:
-        return {
-            "account_active": self.account.status == AccountStatus.ACTIVE,
-            "trading_enabled": not self.account.trading_blocked,
-            "account_healthy": not self.account.account_blocked,
-            "day_trades": self.account.daytrade_count,
-            "pdt_status": self.account.pattern_day_trader
-        }
-
-    def verify_buying_power(self) -> dict[str, Any]:
-        return {
-            "total_portfolio": Decimal(self.account.portfolio_value),
-            "buying_power": Decimal(self.account.buying_power),
-            "cash": Decimal(self.account.cash),
-            "margin_multiplier": self.account.multiplier
-        }
+        if AccountVerification._AccountStatus is None:
+            from alpaca.trading.enums import AccountStatus
+            AccountVerification._AccountStatus = AccountStatus
+        self.client = _client(api_key, secret_key)
 
-def main():
-    api_key = os.getenv("API_KEY")
-    secret_key = os.getenv("SECRET_KEY")
+    async def load(self) -> None:
+        """Fetch account, market clock and positions concurrently."""
+        limit = asyncio.Semaphore(_REQUEST_LIMIT)
+
+        async def fetch(func, *args):
+            async with limit:
+                return await asyncio.to_thread(func, *args)
+
+        self.account, self.clock, self.positions = await asyncio.gather(
+            fetch(_get_account_cached, self.client),
+            fetch(self.client.get_clock),
+            fetch(self.client.get_all_positions)
+        )
+
+    def verify_trading_status(self) -> TradingStatus:
+        return TradingStatus(
+            account_active=self.account.status is self._AccountStatus.ACTIVE,
+            trading_enabled=not self.account.trading_blocked,
+            account_healthy=not self.account.account_blocked,
+            day_trades=self.account.daytrade_count,
+            pdt_status=self.account.pattern_day_trader
+        )
+
+    def verify_buying_power(self) -> BuyingPower:
+        return BuyingPower(self.account)
+
+async def _amain():
+    # Checked before anything imports alpaca-py, so missing credentials fail fast
+    env = os.environ
+    api_key = env.get("API_KEY")
+    secret_key = env.get("SECRET_KEY")
 
-    if not all([api_key, secret_key]):
+    if not (api_key and secret_key):
         print("ERROR: API credentials not found in environment variables")
         sys.exit(1)
 
+    lines = []
     try:
         verifier = AccountVerification(api_key, secret_key)
+        await verifier.load()
         
         trading_status = verifier.verify_trading_status()
-        buying_power = verifier.verify_buying_power()
+        ready = (
+            trading_status.account_active
+            and trading_status.trading_enabled
+            and trading_status.account_healthy
+        )
+
+        lines.append(STATUS_TEMPLATE.format(
+            account_active=_MARKS[trading_status.account_active],
+            trading_enabled=_MARKS[trading_status.trading_enabled],
+            account_healthy=_MARKS[trading_status.account_healthy],
+            day_trades=trading_status.day_trades,
+            pdt_status='Yes' if trading_status.pdt_status else 'No',
+            market_open='Yes' if verifier.clock.is_open else 'No'
+        ))
 
-        print("\nTrading Status:")
-        print(f"Account Active: {'✓' if trading_status['account_active'] else '✗'}")
-        print(f"Trading Enabled: {'✓' if trading_status['trading_enabled'] else '✗'}")
-        print(f"Account Healthy: {'✓' if trading_status['account_healthy'] else '✗'}")
-        print(f"Day Trades Today: {trading_status['day_trades']}")
-        print(f"Pattern Day Trader: {'Yes' if trading_status['pdt_status'] else 'No'}")
-
-        print("\nAccount Balance:")
-        print(f"Portfolio Value: ${buying_power['total_portfolio']:,.2f}")
-        print(f"Buying Power: ${buying_power['buying_power']:,.2f}")
-        print(f"Cash: ${buying_power['cash']:,.2f}")
-        print(f"Margin Multiplier: {buying_power['margin_multiplier']}x")
-
-        if all([
-            trading_status['account_active'],
-            trading_status['trading_enabled'],
-            trading_status['account_healthy']
-        ]):
-            print("\n✓ Account ready for trading")
-            return 0
-        else:
-            print("\n✗ Account not ready for trading")
+        if not ready:
+            lines.append("\n✗ Account not ready for trading")
             return 1
 
+        buying_power = verifier.verify_buying_power()
+
+        lines.append(BALANCE_TEMPLATE.format(
+            total_portfolio=_cents(buying_power.total_portfolio),
+            buying_power=_cents(buying_power.buying_power),
+            cash=_cents(buying_power.cash),
+            margin_multiplier=buying_power.margin_multiplier,
+            open_positions=len(verifier.positions)
+        ))
+
+        lines.append("\n✓ Account ready for trading")
+        return 0
+
     except Exception as e:
-        print(f"Error during verification: {str(e)}")
+        _invalidate_account_cache()
+        lines.append(f"Error during verification: {str(e)}")
         return 1
+    finally:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+def main():
+    return asyncio.run(_amain())
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
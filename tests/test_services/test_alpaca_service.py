@@ -0,0 +1,95 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+from aiohttp import web
+
+from services.alpaca_service import (
+    AlpacaConfig,
+    AsyncTradingService,
+    TradingService,
+    close_trading_services,
+    get_trading_service,
+)
+
+
+def place_order(handler, **order):
+    """Place one order against a local server that answers with handler."""
+    async def run():
+        app = web.Application()
+        app.router.add_post("/v2/orders", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        config = AlpacaConfig("key", "secret", base_url=f"http://127.0.0.1:{port}")
+        try:
+            async with AsyncTradingService(config) as service:
+                return await service.place_stop_limit_order(**order)
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(run())
+
+
+ORDER = dict(symbol="AAPL", qty=1, limit_price=Decimal("181.5"), stop_price=Decimal("181.2"))
+
+
+def test_order_payload_and_headers():
+    received = {}
+
+    async def handler(request):
+        received["headers"] = request.headers
+        received["body"] = await request.json()
+        return web.json_response({"id": "order-1"})
+
+    assert place_order(handler, **ORDER) == {"id": "order-1"}
+    assert received["headers"]["APCA-API-KEY-ID"] == "key"
+    assert received["body"] == {
+        "symbol": "AAPL",
+        "qty": "1",
+        "side": "buy",
+        "type": "stop_limit",
+        "time_in_force": "gtc",
+        "limit_price": "181.50",
+        "stop_price": "181.20",
+    }
+
+
+def test_http_error_is_wrapped_once():
+    async def handler(request):
+        return web.json_response({"message": "rejected"}, status=422)
+
+    with pytest.raises(RuntimeError) as excinfo:
+        place_order(handler, **ORDER)
+
+    assert str(excinfo.value).count("Order placement failed") == 1
+    assert "HTTP 422" in str(excinfo.value)
+
+
+def test_closing_one_service_keeps_other_pools():
+    first = TradingService(AlpacaConfig("key", "secret"))
+    second = TradingService(AlpacaConfig("key", "secret"))
+    adapter = second._session.get_adapter("https://paper-api.alpaca.markets")
+    assert adapter is not first._session.get_adapter("https://paper-api.alpaca.markets")
+
+    adapter.poolmanager.connection_from_url("https://paper-api.alpaca.markets")
+    first.close()
+    assert len(adapter.poolmanager.pools) == 1
+
+
+def test_config_change_keeps_held_service_open():
+    paper = get_trading_service(AlpacaConfig("key", "secret"))
+    adapter = paper._session.get_adapter("https://paper-api.alpaca.markets")
+    adapter.poolmanager.connection_from_url("https://paper-api.alpaca.markets")
+
+    live = get_trading_service(AlpacaConfig("key", "secret", paper=False))
+    assert live is not paper
+    assert len(adapter.poolmanager.pools) == 1
+    assert get_trading_service(AlpacaConfig("key", "secret")) is paper
+
+    close_trading_services()
+    assert len(adapter.poolmanager.pools) == 0
+    assert get_trading_service(AlpacaConfig("key", "secret")) is not paper
+    close_trading_services()
@@ -0,0 +1,66 @@
+import asyncio
+from types import SimpleNamespace
+
+from alpaca.trading.client import TradingClient
+
+from services.order_monitor import OrderMonitor
+
+
+def test_stream_is_built_from_client_credentials():
+    monitor = OrderMonitor(TradingClient("key", "secret", paper=True))
+
+    stream = monitor._build_stream()
+
+    assert stream is not None
+    assert stream._api_key == "key"
+    assert stream._secret_key == "secret"
+
+
+def test_stream_uses_default_endpoint_for_default_client():
+    monitor = OrderMonitor(TradingClient("key", "secret", paper=False))
+
+    assert monitor._build_stream()._endpoint == "wss://api.alpaca.markets/stream"
+
+
+def test_stream_follows_rest_url_override():
+    client = TradingClient("key", "secret", url_override="https://broker.example.com/")
+
+    assert OrderMonitor(client)._build_stream()._endpoint == "wss://broker.example.com/stream"
+
+
+def test_stop_before_start_outside_loop():
+    monitor = OrderMonitor(TradingClient("key", "secret"))
+    monitor.stream = monitor._build_stream()
+
+    monitor.stop_monitoring()
+
+    assert monitor._stop_task is None
+
+
+def test_stream_falls_back_to_polling_without_credentials():
+    assert OrderMonitor(SimpleNamespace())._build_stream() is None
+
+
+def test_trade_updates_dispatch_to_handlers():
+    monitor = OrderMonitor(SimpleNamespace(), use_stream=False)
+    handled = []
+
+    async def on_filled(order):
+        handled.append(("filled", order.id))
+
+    async def on_cancelled(order):
+        handled.append(("cancelled", order.id))
+
+    monitor._handle_filled_order = on_filled
+    monitor._handle_cancelled_order = on_cancelled
+
+    async def run():
+        for event, order_id in [("new", 1), ("fill", 1), ("new", 2), ("expired", 2)]:
+            await monitor._on_trade_update(
+                SimpleNamespace(event=event, order=SimpleNamespace(id=order_id))
+            )
+
+    asyncio.run(run())
+
+    assert handled == [("filled", 1), ("cancelled", 2)]
+    assert monitor.active_orders == {}
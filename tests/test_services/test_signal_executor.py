@@ -0,0 +1,72 @@
+import sys
+import textwrap
+
+import pytest
+
+from services import signal_executor
+from services.signal_executor import SignalExecutor
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A fake Poetry project whose modules are importable in-process."""
+    (tmp_path / "poetry.lock").touch()
+    (tmp_path / "script.py").touch()
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    def write_module(name, source):
+        (tmp_path / f"{name}.py").write_text(textwrap.dedent(source))
+        monkeypatch.delitem(sys.modules, name, raising=False)
+        return SignalExecutor(str(tmp_path / "script.py"), str(tmp_path), module_name=name)
+
+    return tmp_path, write_module
+
+
+def test_in_process_runs_in_project_dir_and_captures_import_output(project):
+    path, write_module = project
+    executor = write_module("sig_cwd", """
+        import os
+        print("loaded: yes")
+
+        def main():
+            print(f"cwd: {os.getcwd()}")
+    """)
+
+    assert executor.execute() == {"loaded": "yes", "cwd": str(path)}
+
+
+def test_dict_result_is_returned_directly(project):
+    _, write_module = project
+    executor = write_module("sig_dict", """
+        def main():
+            return {"signal": "BUY"}
+    """)
+
+    assert executor.execute() == {"signal": "BUY"}
+
+
+def test_script_errors_are_wrapped_in_runtime_error(project):
+    _, write_module = project
+    executor = write_module("sig_error", """
+        def main():
+            raise KeyError("boom")
+    """)
+
+    with pytest.raises(RuntimeError):
+        executor.execute()
+
+
+def test_module_without_main_falls_back_to_subprocess(project, monkeypatch):
+    _, write_module = project
+    executor = write_module("sig_no_main", "VALUE = 1\n")
+    calls = []
+
+    def fake_run(*args, **kwargs):
+        calls.append(args[0])
+        return type("Result", (), {"stdout": "via: subprocess", "stderr": ""})()
+
+    monkeypatch.setattr(signal_executor.subprocess, "run", fake_run)
+
+    assert executor.execute() == {"via": "subprocess"}
+    assert executor.module_name == "sig_no_main"
+    assert calls[-1][:3] == ["poetry", "run", "python"]
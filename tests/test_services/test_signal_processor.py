@@ -0,0 +1,70 @@
+import json
+from decimal import Decimal
+
+import pytest
+
+from services.signal_processor import process_trading_signals
+
+
+def make_signal(entry_price, recommended_size, confidence=0.8, risk_reward=2.0):
+    return {
+        "date": "2025-01-02",
+        "current_price": entry_price,
+        "signal": {"type": "BUY", "confidence": confidence},
+        "orders": {
+            "entry": {"stop_price": entry_price, "limit_price": entry_price},
+            "take_profit": {"price": 1},
+            "stop_loss": {"price": 1},
+        },
+        "position_size": {"recommended_size": recommended_size},
+        "time_barrier": {"days": 5, "expiry_date": "2025-01-07"},
+        "metrics": {"daily_volatility": 0.01, "risk_reward_ratio": risk_reward},
+    }
+
+
+def write_signals(tmp_path, signals):
+    path = tmp_path / "orders_test.json"
+    path.write_text(json.dumps(signals))
+    return path
+
+
+@pytest.mark.parametrize(
+    "account_value, entry_price, recommended_size, expected_shares",
+    [
+        (Decimal("100000"), 290, "29%", 100),
+        (Decimal("100"), 1, "29%", 29),
+    ],
+)
+def test_position_size_matches_decimal_math(
+    tmp_path, account_value, entry_price, recommended_size, expected_shares
+):
+    path = write_signals(tmp_path, {"AAPL_w1": make_signal(entry_price, recommended_size)})
+
+    signals = process_trading_signals(path, account_value=account_value)
+
+    (signal, shares), = signals["AAPL"]
+    assert shares == expected_shares
+    assert signal.window_weeks == 1
+
+
+@pytest.mark.parametrize("entry_price", [0, -5])
+def test_non_positive_entry_price_raises(tmp_path, entry_price):
+    path = write_signals(tmp_path, {"AAPL_w1": make_signal(entry_price, "5%")})
+
+    with pytest.raises(ValueError):
+        process_trading_signals(path, account_value=Decimal("100000"))
+
+
+def test_filters_by_symbol_confidence_and_risk_reward(tmp_path):
+    path = write_signals(tmp_path, {
+        "AAPL_w1": make_signal(100, "5%"),
+        "MSFT_w2": make_signal(100, "5%", confidence=0.1),
+        "TSLA_w1": make_signal(100, "5%", risk_reward=1.0),
+        "NVDA_w3": make_signal(100, "5%"),
+    })
+
+    signals = process_trading_signals(
+        path, account_value=Decimal("100000"), target_symbols=["AAPL", "MSFT", "TSLA"]
+    )
+
+    assert list(signals) == ["AAPL"]
@@ -0,0 +1,35 @@
+import os
+
+from utils.file_utils import get_latest_signals_file
+
+
+def touch(path, mtime_s):
+    path.write_text("{}")
+    os.utime(path, ns=(mtime_s * 10**9, mtime_s * 10**9))
+
+
+def test_returns_newest_signals_file(tmp_path):
+    touch(tmp_path / "orders_a.json", 1_000)
+    touch(tmp_path / "orders_b.json", 2_000)
+    touch(tmp_path / "other.json", 3_000)
+
+    assert get_latest_signals_file(tmp_path) == tmp_path / "orders_b.json"
+
+
+def test_in_place_rewrite_is_seen(tmp_path):
+    touch(tmp_path / "orders_a.json", 1_000)
+    touch(tmp_path / "orders_b.json", 2_000)
+    assert get_latest_signals_file(tmp_path) == tmp_path / "orders_b.json"
+
+    # Rewriting an existing file leaves the directory mtime unchanged
+    dir_mtime_ns = tmp_path.stat().st_mtime_ns
+    touch(tmp_path / "orders_a.json", 3_000)
+    assert tmp_path.stat().st_mtime_ns == dir_mtime_ns
+
+    assert get_latest_signals_file(tmp_path) == tmp_path / "orders_a.json"
+
+
+def test_no_match_returns_none(tmp_path):
+    touch(tmp_path / "other.json", 1_000)
+
+    assert get_latest_signals_file(tmp_path) is None
@@ -0,0 +1,46 @@
+import logging
+
+import pytest
+
+from utils import logger as logger_module
+from utils.logger import setup_logger
+
+
+@pytest.fixture
+def flush_logs():
+    """Stop the shared listener so every queued record has been written."""
+    yield logger_module._stop_listener
+    logger_module._stop_listener()
+
+
+def test_child_logger_records_reach_parent_handlers(tmp_path, flush_logs):
+    log_file = tmp_path / "parent.log"
+    setup_logger("test_parent", log_file=log_file)
+
+    logging.getLogger("test_parent.child").info("from child")
+    flush_logs()
+
+    assert "from child" in log_file.read_text()
+
+
+def test_loggers_write_to_their_own_files(tmp_path, flush_logs):
+    first_file = tmp_path / "first.log"
+    second_file = tmp_path / "second.log"
+    first = setup_logger("test_first", log_file=first_file)
+    second = setup_logger("test_second", log_file=second_file)
+
+    first.info("first message")
+    second.info("second message")
+    flush_logs()
+
+    assert first_file.read_text().count("first message") == 1
+    assert "second message" not in first_file.read_text()
+    assert second_file.read_text().count("second message") == 1
+
+
+def test_repeated_setup_does_not_duplicate_handlers(tmp_path):
+    log_file = tmp_path / "repeat.log"
+    logger = setup_logger("test_repeat", log_file=log_file)
+
+    assert setup_logger("test_repeat", log_file=log_file) is logger
+    assert len(logger.handlers) == 1
@@ -0,0 +1,138 @@
+import asyncio
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from alpaca.trading.enums import AccountStatus
+
+from utils import verify_setup
+
+
+class FakeClient:
+    """Stand-in for TradingClient that counts account requests."""
+
+    def __init__(self, account, clock_error=None):
+        self.account = account
+        self.clock_error = clock_error
+        self.account_calls = 0
+
+    def get_account(self):
+        self.account_calls += 1
+        return self.account
+
+    def get_clock(self):
+        if self.clock_error is not None:
+            raise self.clock_error
+        return SimpleNamespace(is_open=True)
+
+    def get_all_positions(self):
+        return [object(), object()]
+
+
+def make_account(**overrides):
+    fields = dict(
+        status=AccountStatus.ACTIVE,
+        trading_blocked=False,
+        account_blocked=False,
+        daytrade_count=0,
+        pattern_day_trader=False,
+        portfolio_value="100000.005",
+        buying_power="2.675",
+        cash="0.015",
+        multiplier="4",
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+@pytest.fixture(autouse=True)
+def clear_account_cache():
+    verify_setup._invalidate_account_cache()
+    yield
+    verify_setup._invalidate_account_cache()
+
+
+@pytest.fixture
+def run_verification(monkeypatch, capsys):
+    """Run _amain against a fake client; return (exit code, report)."""
+    monkeypatch.setenv("API_KEY", "key")
+    monkeypatch.setenv("SECRET_KEY", "secret")
+
+    def run(client):
+        monkeypatch.setattr(verify_setup, "_client", lambda *args: client)
+        code = asyncio.run(verify_setup._amain())
+        return code, capsys.readouterr().out
+
+    return run
+
+
+def test_account_snapshot_reused_within_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(verify_setup.time, "monotonic", lambda: now[0])
+    client = FakeClient(make_account())
+
+    verify_setup._get_account_cached(client)
+    now[0] += verify_setup._ACCOUNT_TTL / 2
+    verify_setup._get_account_cached(client)
+    assert client.account_calls == 1
+
+    now[0] += verify_setup._ACCOUNT_TTL
+    verify_setup._get_account_cached(client)
+    assert client.account_calls == 2
+
+
+def test_snapshots_are_per_client():
+    first = FakeClient(make_account(cash="1"))
+    second = FakeClient(make_account(cash="2"))
+
+    assert verify_setup._get_account_cached(first).cash == "1"
+    assert verify_setup._get_account_cached(second).cash == "2"
+
+
+def test_failure_invalidates_account_cache(run_verification):
+    client = FakeClient(make_account(), clock_error=RuntimeError("clock down"))
+
+    code, report = run_verification(client)
+
+    assert code == 1
+    assert "Error during verification: clock down" in report
+    assert client not in verify_setup._account_cache
+
+
+def test_ready_report(run_verification):
+    code, report = run_verification(FakeClient(make_account()))
+
+    assert code == 0
+    assert "Account Active: ✓" in report
+    assert "Market Open: Yes" in report
+    assert "Portfolio Value: $100,000.00" in report
+    assert "Buying Power: $2.68" in report
+    assert "Cash: $0.02" in report
+    assert "Margin Multiplier: 4x" in report
+    assert "Open Positions: 2" in report
+    assert report.rstrip().endswith("✓ Account ready for trading")
+
+
+def test_not_ready_report_has_no_balance(run_verification):
+    code, report = run_verification(FakeClient(make_account(trading_blocked=True)))
+
+    assert code == 1
+    assert "Trading Enabled: ✗" in report
+    assert "Account Balance" not in report
+    assert report.rstrip().endswith("✗ Account not ready for trading")
+
+
+def test_import_does_not_load_alpaca():
+    src = Path(verify_setup.__file__).resolve().parents[1]
+    result = subprocess.run(
+        [
+            sys.executable, "-c",
+            "import sys; import utils.verify_setup; "
+            "print(any(name.split('.')[0] == 'alpaca' for name in sys.modules))",
+        ],
+        cwd=src, capture_output=True, text=True, check=True,
+    )
+
+    assert result.stdout.strip() == "False"